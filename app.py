@@ -1,22 +1,41 @@
 #!/usr/bin/env python3
 """Flask web interface for the ACSM to EPUB converter (EPUB sources only)."""
 
+import glob
+import heapq
 import json
+import multiprocessing
 import os
+import queue
+import shutil
 import threading
 import time
 import zipfile
-import xml.etree.ElementTree as ET
-from collections import OrderedDict
+
+try:
+    from lxml import etree as ET  # much faster parser, same API surface
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    import orjson  # optional: much faster JSON (de)serialization
+except ImportError:
+    orjson = None
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from functools import wraps
+from io import BytesIO
 from pathlib import Path
+from urllib.parse import unquote
 
-from flask import Flask, jsonify, make_response, render_template, request, send_from_directory, session, redirect, url_for
+from flask import Flask, Response, jsonify, make_response, render_template, request, send_from_directory, session, redirect, url_for
 
 from converter import convert_pipeline
 
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", os.urandom(24).hex())
+app.config["MAX_CONTENT_LENGTH"] = 10 * 1024 * 1024  # ACSM tokens are tiny
 
 APP_PASSWORD = os.environ.get("APP_PASSWORD", "")
 
@@ -31,6 +50,8 @@ COVER_DIR.mkdir(exist_ok=True)
 
 TOTAL_STEPS = 6
 
+PAGE_SIZE = 50  # books shown per index page
+
 STEP_LABELS = {
     1: "Checking tools...",
     2: "Detecting format...",
@@ -41,7 +62,10 @@ STEP_LABELS = {
 }
 
 # Track active conversions: job_id -> {steps: [...], status, error}
+# Guarded by _jobs_lock for membership changes; the fields of each job are
+# guarded by the job's own "cond" (its lock is reentrant).
 active_jobs = {}
+_jobs_lock = threading.Lock()
 
 
 def login_required(f):
@@ -73,96 +97,331 @@ def logout():
     return redirect(url_for("login"))
 
 
+def _json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Cover lookups already done this process: (path, mtime_ns, size) -> cover
+# filename (or None for EPUBs we failed to parse, so we don't retry them).
+_cover_cache = {}
+_cover_cache_lock = threading.Lock()
+
+# On-disk version of the same lookups, so a restart doesn't re-open every
+# EPUB zip on the first index render: {stem: {"mtime": mtime_ns, "cover": ...}}
+_COVER_INDEX_PATH = COVER_DIR / ".opf_index.json"
+
+
+def _load_cover_index():
+    try:
+        return _json_loads(_COVER_INDEX_PATH.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+_cover_index = _load_cover_index()  # guarded by _cover_cache_lock
+_cover_index_dirty = False  # set on insert/delete, cleared by the flush
+
+
+def _flush_cover_index():
+    """Write the cover index atomically if it changed since the last flush.
+
+    Inserts only mark the index dirty; callers flush once per batch (end of
+    a get_books render, cleanup) rather than rewriting the file per cover.
+    """
+    global _cover_index_dirty
+    with _cover_cache_lock:
+        if not _cover_index_dirty:
+            return
+        _cover_index_dirty = False
+        tmp = COVER_DIR / ".opf_index.json.tmp"
+        try:
+            tmp.write_bytes(_json_dumps(_cover_index))
+            os.replace(tmp, _COVER_INDEX_PATH)
+        except OSError:
+            pass
+
+
+def clear_cover_cache(stem=None):
+    """Drop cached cover lookups (called after download cleanup deletes files)."""
+    global _cover_index_dirty
+    with _cover_cache_lock:
+        _cover_cache.clear()
+        if stem is None:
+            _cover_index.clear()
+        else:
+            _cover_index.pop(stem, None)
+        _cover_index_dirty = True
+    _flush_cover_index()
+
+
 def extract_epub_cover(epub_path):
+    try:
+        st = epub_path.stat()
+    except OSError:
+        return None
+    cache_key = (str(epub_path), st.st_mtime_ns, st.st_size)
+    stem = epub_path.stem
+    with _cover_cache_lock:
+        if cache_key in _cover_cache:
+            return _cover_cache[cache_key]
+        indexed = _cover_index.get(stem)
+        if indexed and indexed.get("mtime") == st.st_mtime_ns:
+            cover = indexed.get("cover")
+            _cover_cache[cache_key] = cover
+            return cover
+    cover = _extract_epub_cover_uncached(epub_path)
+    global _cover_index_dirty
+    with _cover_cache_lock:
+        _cover_cache[cache_key] = cover
+        _cover_index[stem] = {"mtime": st.st_mtime_ns, "cover": cover}
+        _cover_index_dirty = True
+    return cover
+
+
+def _extract_epub_cover_uncached(epub_path):
     cover_out = COVER_DIR / f"{epub_path.stem}.jpg"
     if cover_out.exists():
         return cover_out.name
     try:
         with zipfile.ZipFile(epub_path, "r") as zf:
-            cover_name = _find_cover_in_opf(zf) or _find_cover_by_name(zf)
+            names = zf.namelist()
+            cover_name = _find_cover_in_opf(zf, names) or _find_cover_by_name(names)
             if cover_name:
-                data = zf.read(cover_name)
                 ext = Path(cover_name).suffix or ".jpg"
                 cover_out = COVER_DIR / f"{epub_path.stem}{ext}"
-                cover_out.write_bytes(data)
+                # Stream at a fixed buffer size instead of loading the whole
+                # image into memory first
+                with zf.open(cover_name) as src, open(cover_out, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=65536)
                 return cover_out.name
     except Exception:
         pass
     return None
 
 
-def _find_cover_in_opf(zf):
-    opf_path = next((n for n in zf.namelist() if n.endswith(".opf")), None)
+def _find_cover_in_opf(zf, names):
+    opf_path = next((n for n in names if n.endswith(".opf")), None)
     if not opf_path:
         return None
-    opf_xml = zf.read(opf_path).decode("utf-8", errors="replace")
-    root = ET.fromstring(opf_xml)
+    # Stream the OPF instead of building the full tree: collect manifest
+    # item hrefs as they appear and stop as soon as the <meta name="cover">
+    # id has been seen and its item resolved.
     cover_id = None
-    for meta in root.iter():
-        if meta.tag.endswith("}meta") or meta.tag == "meta":
-            if meta.get("name") == "cover":
-                cover_id = meta.get("content")
-                break
-    if not cover_id:
-        for item in root.iter():
-            if item.tag.endswith("}item") or item.tag == "item":
-                if "cover-image" in (item.get("properties") or ""):
-                    href = item.get("href")
-                    if href:
-                        opf_dir = str(Path(opf_path).parent)
-                        return href if opf_dir == "." else f"{opf_dir}/{href}"
+    properties_href = None
+    items = {}
+    for _, elem in ET.iterparse(BytesIO(zf.read(opf_path)), events=("start",)):
+        local = elem.tag.rpartition("}")[2]
+        if local == "meta":
+            if cover_id is None and elem.get("name") == "cover":
+                cover_id = elem.get("content")
+        elif local == "item":
+            href = elem.get("href")
+            if href:
+                items[elem.get("id")] = href
+                if properties_href is None and "cover-image" in (elem.get("properties") or ""):
+                    properties_href = href
+        if cover_id is not None and cover_id in items:
+            break
+        elem.clear()
+    href = items.get(cover_id) if cover_id else properties_href
+    if not href:
         return None
-    for item in root.iter():
-        if item.tag.endswith("}item") or item.tag == "item":
-            if item.get("id") == cover_id:
-                href = item.get("href")
-                if href:
-                    opf_dir = str(Path(opf_path).parent)
-                    return href if opf_dir == "." else f"{opf_dir}/{href}"
-    return None
+    opf_dir = str(Path(opf_path).parent)
+    return href if opf_dir == "." else f"{opf_dir}/{href}"
 
 
-def _find_cover_by_name(zf):
-    for name in zf.namelist():
+def _find_cover_by_name(names):
+    exts = (".jpg", ".jpeg", ".png")
+    for name in names:
         lower = name.lower()
-        if "cover" in lower and any(lower.endswith(ext) for ext in (".jpg", ".jpeg", ".png")):
+        if "cover" in lower and lower.endswith(exts):
             return name
     return None
 
 
-def get_books():
-    if not OUTPUT_DIR.exists():
+# Cover extraction is I/O-bound (zip reads release the GIL), so a few
+# threads turn per-book extraction time into roughly max() instead of sum()
+_cover_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cover")
+
+
+def _scandir_names(directory):
+    """List entry names in a directory without materializing Path objects."""
+    try:
+        with os.scandir(directory) as it:
+            return [e.name for e in it]
+    except FileNotFoundError:
         return []
-    books = OrderedDict()
-    for f in sorted(OUTPUT_DIR.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
-        if f.suffix == ".epub":
-            stem = f.stem
-            if stem not in books:
-                books[stem] = {"stem": stem, "files": [], "cover": None}
-            size_mb = f.stat().st_size / (1024 * 1024)
-            books[stem]["files"].append({
-                "name": f.name,
-                "size": f"{size_mb:.1f} MB",
-                "ext": "EPUB",
-            })
-            if not books[stem]["cover"]:
-                cover = extract_epub_cover(f)
-                if cover:
-                    books[stem]["cover"] = cover
-    return list(books.values())
 
 
-def run_conversion_job(job_id, acsm_path, output_dir):
-    """Run conversion in a background thread, updating active_jobs."""
+def get_books(page=0):
+    """Return (books, has_next) for one page of the shelf, newest first."""
+    if not OUTPUT_DIR.exists():
+        return [], False
+    # One stat per file: the result drives both the mtime sort and the size
+    with os.scandir(OUTPUT_DIR) as it:
+        entries = [
+            (e, e.stat(follow_symlinks=False))
+            for e in it
+            if e.name.endswith(".epub")
+        ]
+    # Heap-select just the slice being displayed instead of sorting the
+    # whole library
+    start = page * PAGE_SIZE
+    end = start + PAGE_SIZE
+    top = heapq.nlargest(end, entries, key=lambda pair: pair[1].st_mtime)[start:]
+    has_next = len(entries) > end
+    books = {}
+    pending = {}  # stem -> epub to pull a cover from
+    for entry, st in top:
+        stem = entry.name[:-len(".epub")]
+        book = books.get(stem)
+        if book is None:
+            book = books[stem] = {"stem": stem, "files": [], "cover": None}
+        size_mb = st.st_size / (1024 * 1024)
+        book["files"].append({
+            "name": entry.name,
+            "size": f"{size_mb:.1f} MB",
+            "ext": "EPUB",
+        })
+        if stem not in pending:
+            pending[stem] = Path(entry.path)
+    if pending:
+        futures = {
+            _cover_pool.submit(extract_epub_cover, path): stem
+            for stem, path in pending.items()
+        }
+        for fut in as_completed(futures):
+            cover = fut.result()
+            if cover:
+                books[futures[fut]]["cover"] = cover
+        _flush_cover_index()
+    return list(books.values()), has_next
+
+
+def _job_changed(job):
+    """Bump the job version and wake any /job-stream listeners."""
+    with job["cond"]:
+        job["version"] += 1
+        job["cond"].notify_all()
+
+
+def _job_snapshot(job):
+    """Build the progress dict sent to clients (SSE and polling fallback)."""
+    with job["cond"]:
+        return {
+            "status": job["status"],
+            "steps": list(job["steps"]),
+            "current_step": job["current_step"],
+            "current_label": job["current_label"],
+            "error": job["error"],
+            "done_message": job["done_message"],
+            "elapsed": round(time.time() - job["start_time"]),
+        }
+
+
+# Conversion pipelines run in worker processes so their Python-level work
+# (XML parsing, orchestration) never holds this interpreter's GIL. Created
+# lazily so importing the module (CLI, tests) doesn't spawn processes.
+_conversion_pool = None
+_queue_manager = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _conversion_pool, _queue_manager
+    with _pool_lock:
+        if _conversion_pool is None:
+            _conversion_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            _queue_manager = multiprocessing.Manager()
+        return _conversion_pool, _queue_manager
+
+
+def _reset_pool():
+    """Discard a broken pool so the next job rebuilds it from scratch."""
+    global _conversion_pool, _queue_manager
+    with _pool_lock:
+        if _conversion_pool is not None:
+            _conversion_pool.shutdown(wait=False)
+        # Drop the manager reference without shutdown(): in-flight drains
+        # still hold queue proxies, and its process exits with them.
+        _conversion_pool = None
+        _queue_manager = None
+
+
+def _pipeline_worker(acsm_path, output_dir, step_queue):
+    """Run convert_pipeline in a worker process, shipping steps back over a queue."""
     import traceback
-    job = active_jobs[job_id]
-    print(f"[DEBUG] Job {job_id} started: acsm={acsm_path}, output={output_dir}", flush=True)
     try:
+        for step, message in convert_pipeline(acsm_path, output_dir):
+            step_queue.put(("step", step, message))
+        step_queue.put(("exit", None, None))
+    except RuntimeError as e:
+        step_queue.put(("error", str(e), None))
+    except Exception as e:
+        step_queue.put(("error", f"Unexpected error: {e}", traceback.format_exc()))
+
+
+def run_conversion_job(job_id, acsm_path, output_dir):
+    """Drive one conversion: submit it to the process pool and drain its steps."""
+    with _jobs_lock:
+        job = active_jobs[job_id]
+    print(f"[DEBUG] Job {job_id} started: acsm={acsm_path}, output={output_dir}", flush=True)
+    with job["cond"]:
         job["current_step"] = 1
         job["current_label"] = STEP_LABELS[1]
+        _job_changed(job)
 
-        for step, message in convert_pipeline(str(acsm_path), str(output_dir)):
-            print(f"[DEBUG] Job {job_id} step={step} message={message}", flush=True)
+    try:
+        pool, manager = _get_pool()
+        step_queue = manager.Queue()
+        future = pool.submit(_pipeline_worker, str(acsm_path), str(output_dir), step_queue)
+    except (BrokenProcessPool, OSError, EOFError) as e:
+        # A worker death poisons the whole pool; every later submit raises.
+        # Fail this job visibly and discard the pool so the next rebuilds it.
+        print(f"[DEBUG] Job {job_id} could not be submitted: {e}", flush=True)
+        with job["cond"]:
+            job["status"] = "error"
+            job["error"] = f"Conversion backend unavailable, please retry: {e}"
+            _job_changed(job)
+        _reset_pool()
+        return
+
+    while True:
+        try:
+            kind, a, b = step_queue.get(timeout=1)
+        except queue.Empty:
+            if future.done():
+                # Worker died without reporting (killed, broken pool, ...)
+                exc = future.exception()
+                print(f"[DEBUG] Job {job_id} worker exited abnormally: {exc}", flush=True)
+                with job["cond"]:
+                    job["status"] = "error"
+                    job["error"] = f"Conversion worker exited unexpectedly: {exc or 'no error reported'}"
+                    _job_changed(job)
+                if isinstance(exc, BrokenProcessPool):
+                    _reset_pool()
+                return
+            continue
+
+        if kind == "exit":
+            return
+        if kind == "error":
+            print(f"[DEBUG] Job {job_id} error: {a}\n{b or ''}", flush=True)
+            with job["cond"]:
+                job["status"] = "error"
+                job["error"] = a
+                _job_changed(job)
+            return
+
+        step, message = a, b
+        print(f"[DEBUG] Job {job_id} step={step} message={message}", flush=True)
+        with job["cond"]:
             if step == "done":
                 job["steps"].append({"step": "done", "message": message})
                 job["status"] = "done"
@@ -180,21 +439,40 @@ def run_conversion_job(job_id, acsm_path, output_dir):
                 if next_step <= TOTAL_STEPS:
                     job["current_step"] = next_step
                     job["current_label"] = STEP_LABELS[next_step]
-    except RuntimeError as e:
-        print(f"[DEBUG] Job {job_id} RuntimeError: {e}", flush=True)
-        job["status"] = "error"
-        job["error"] = str(e)
-    except Exception as e:
-        print(f"[DEBUG] Job {job_id} Exception: {e}\n{traceback.format_exc()}", flush=True)
-        job["status"] = "error"
-        job["error"] = f"Unexpected error: {e}"
+            _job_changed(job)
+
+
+# Bounded job workers: /start-convert only enqueues; these threads drive
+# the conversions (each submits to the process pool and drains its steps),
+# so an upload burst queues instead of spawning a thread per request.
+_job_queue = queue.Queue()
+_JOB_WORKERS = max(2, os.cpu_count() or 2)
+
+
+def _job_worker():
+    while True:
+        args = _job_queue.get()
+        try:
+            run_conversion_job(*args)
+        except Exception as e:
+            print(f"[DEBUG] Job worker error: {e}", flush=True)
+        finally:
+            _job_queue.task_done()
+
+
+for _ in range(_JOB_WORKERS):
+    threading.Thread(target=_job_worker, daemon=True).start()
 
 
 @app.route("/")
 @login_required
 def index():
-    books = get_books()
-    resp = make_response(render_template("index.html", books=books))
+    try:
+        page = max(0, int(request.args.get("page", 0)))
+    except ValueError:
+        page = 0
+    books, has_next = get_books(page)
+    resp = make_response(render_template("index.html", books=books, page=page, has_next=has_next))
     resp.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
     return resp
 
@@ -213,6 +491,21 @@ def upload():
     return {"filename": filename}
 
 
+@app.route("/upload-stream", methods=["POST"])
+@login_required
+def upload_stream():
+    """Raw-body upload: streams straight to disk, skipping the multipart parser."""
+    filename = Path(unquote(request.headers.get("X-Filename", ""))).name
+    if not filename:
+        return {"error": "No filename provided"}, 400
+    if not filename.endswith(".acsm"):
+        return {"error": "Only .acsm files are accepted"}, 400
+    save_path = UPLOAD_DIR / filename
+    with open(save_path, "wb") as f:
+        shutil.copyfileobj(request.stream, f, length=65536)
+    return {"filename": filename}
+
+
 @app.route("/start-convert/<filename>", methods=["POST"])
 @login_required
 def start_convert(filename):
@@ -224,23 +517,21 @@ def start_convert(filename):
         return jsonify({"error": "File not found"}), 404
 
     job_id = f"{filename}_{int(time.time())}"
-    active_jobs[job_id] = {
-        "filename": filename,
-        "status": "running",
-        "steps": [],
-        "current_step": 0,
-        "current_label": "",
-        "error": None,
-        "done_message": None,
-        "start_time": time.time(),
-    }
-
-    t = threading.Thread(
-        target=run_conversion_job,
-        args=(job_id, acsm_path, OUTPUT_DIR),
-        daemon=True,
-    )
-    t.start()
+    with _jobs_lock:
+        active_jobs[job_id] = {
+            "filename": filename,
+            "status": "running",
+            "steps": [],
+            "current_step": 0,
+            "current_label": "",
+            "error": None,
+            "done_message": None,
+            "start_time": time.time(),
+            "cond": threading.Condition(),
+            "version": 0,
+        }
+
+    _job_queue.put((job_id, acsm_path, OUTPUT_DIR))
 
     return jsonify({"job_id": job_id})
 
@@ -248,22 +539,85 @@ def start_convert(filename):
 @app.route("/job-status/<job_id>")
 @login_required
 def job_status(job_id):
-    """Poll endpoint: returns current conversion progress."""
-    if job_id not in active_jobs:
+    """Poll endpoint: returns current conversion progress (fallback for SSE)."""
+    with _jobs_lock:
+        job = active_jobs.get(job_id)
+    if job is None:
         return jsonify({"error": "Job not found"}), 404
 
-    job = active_jobs[job_id]
-    elapsed = round(time.time() - job["start_time"])
+    with job["cond"]:
+        version = job["version"]
+        etag = f'W/"{version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=304, headers={"ETag": etag})
+        # Serialize each job version once, however often it is polled
+        cached = job.get("_cached_json")
+        if cached and cached[0] == version:
+            payload = cached[1]
+        else:
+            payload = _json_dumps(_job_snapshot(job))
+            job["_cached_json"] = (version, payload)
+    return Response(payload, mimetype="application/json", headers={"ETag": etag})
+
+
+@app.route("/job-stream/<job_id>")
+@login_required
+def job_stream(job_id):
+    """SSE endpoint: pushes a progress snapshot whenever the job changes."""
+    with _jobs_lock:
+        job = active_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+
+    def generate():
+        cond = job["cond"]
+        last_version = -1
+        while True:
+            with cond:
+                # Re-send unchanged snapshots at most every 15s as keep-alive
+                while job["version"] == last_version and job["status"] == "running":
+                    if not cond.wait(timeout=15):
+                        break
+                last_version = job["version"]
+                snapshot = _job_snapshot(job)
+            yield f"data: {json.dumps(snapshot)}\n\n"
+            if snapshot["status"] != "running":
+                return
+
+    resp = Response(generate(), mimetype="text/event-stream")
+    resp.headers["Cache-Control"] = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
 
-    return jsonify({
-        "status": job["status"],
-        "steps": job["steps"],
-        "current_step": job["current_step"],
-        "current_label": job["current_label"],
-        "error": job["error"],
-        "done_message": job["done_message"],
-        "elapsed": elapsed,
-    })
+
+# Deferred cleanup of downloaded books: request threads only enqueue the
+# filename; a single janitor thread does the unlinking so the WSGI worker
+# is released as soon as the response closes.
+_cleanup_queue = queue.SimpleQueue()
+
+
+def _do_cleanup(filename):
+    stem = Path(filename).stem
+    try:
+        (OUTPUT_DIR / filename).unlink(missing_ok=True)
+    except OSError:
+        pass
+    # Single native glob pass per directory instead of filtering every entry
+    for d in (UPLOAD_DIR, COVER_DIR):
+        for f in d.glob(f"{glob.escape(stem)}*"):
+            try:
+                f.unlink(missing_ok=True)
+            except OSError:
+                pass
+    clear_cover_cache(stem)
+
+
+def _janitor():
+    while True:
+        _do_cleanup(_cleanup_queue.get())
+
+
+threading.Thread(target=_janitor, daemon=True).start()
 
 
 @app.route("/download/<filename>")
@@ -274,21 +628,14 @@ def download(filename):
     if not file_path.exists():
         return {"error": "File not found"}, 404
     resp = send_from_directory(OUTPUT_DIR, filename, as_attachment=True)
+    # In passthrough mode the WSGI server closes the raw file object and the
+    # response's close callbacks never run; stream via iter_encoded instead
+    # so call_on_close actually fires.
+    resp.direct_passthrough = False
 
     @resp.call_on_close
     def cleanup():
-        stem = Path(filename).stem
-        try:
-            file_path.unlink(missing_ok=True)
-        except Exception:
-            pass
-        for d in (UPLOAD_DIR, COVER_DIR):
-            for f in d.iterdir():
-                if f.stem == stem or f.stem.startswith(stem):
-                    try:
-                        f.unlink(missing_ok=True)
-                    except Exception:
-                        pass
+        _cleanup_queue.put(filename)
 
     return resp
 
@@ -304,9 +651,10 @@ def cover(filename):
 @login_required
 def debug_status():
     """Debug endpoint to check server state."""
-    import shutil
     jobs_summary = {}
-    for jid, job in active_jobs.items():
+    with _jobs_lock:
+        jobs = list(active_jobs.items())
+    for jid, job in jobs:
         jobs_summary[jid] = {
             "status": job["status"],
             "steps_count": len(job["steps"]),
@@ -314,8 +662,8 @@ def debug_status():
             "error": job["error"],
             "elapsed": round(time.time() - job["start_time"]),
         }
-    upload_files = [f.name for f in UPLOAD_DIR.iterdir()] if UPLOAD_DIR.exists() else []
-    output_files = [f.name for f in OUTPUT_DIR.iterdir()] if OUTPUT_DIR.exists() else []
+    upload_files = _scandir_names(UPLOAD_DIR)
+    output_files = _scandir_names(OUTPUT_DIR)
     return jsonify({
         "active_jobs": jobs_summary,
         "upload_files": upload_files,
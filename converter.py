@@ -20,8 +20,16 @@ import re
 import shutil
 import subprocess
 import sys
-import xml.etree.ElementTree as ET
+import threading
 import zipfile
+
+try:
+    from lxml import etree as ET  # much faster parser, same API surface
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+from collections import deque
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from urllib.parse import unquote, urlparse
 
@@ -38,8 +46,49 @@ def run(cmd, **kwargs):
     return subprocess.run(cmd, **defaults)
 
 
+def _drain(pipe, buf):
+    """Drain a subprocess pipe into a bounded buffer (runs in a daemon thread)."""
+    with pipe:
+        for line in iter(pipe.readline, ""):
+            buf.append(line)
+
+
+def run_streamed(cmd, timeout):
+    """Run a command, continuously draining its output into bounded buffers.
+
+    The drain threads keep the OS pipes empty so a chatty tool never blocks
+    on a full pipe buffer, and only the most recent lines are retained for
+    error reporting instead of the full output.
+    """
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+    )
+    out_buf = deque(maxlen=64)
+    err_buf = deque(maxlen=64)
+    drainers = [
+        threading.Thread(target=_drain, args=(proc.stdout, out_buf), daemon=True),
+        threading.Thread(target=_drain, args=(proc.stderr, err_buf), daemon=True),
+    ]
+    for t in drainers:
+        t.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+    for t in drainers:
+        t.join(timeout=5)
+    return subprocess.CompletedProcess(cmd, returncode, "".join(out_buf), "".join(err_buf))
+
+
+@lru_cache(maxsize=None)
 def find_tool(name):
-    """Find a tool, checking local build directory first."""
+    """Find a tool, checking local build directory first.
+
+    Cached for the process lifetime: tool locations only change during
+    --setup, which clears the cache.
+    """
     local = LIBGOUROU_BIN / name
     if local.exists() and os.access(local, os.X_OK):
         return str(local)
@@ -151,6 +200,7 @@ def do_setup():
     setup_brew_deps()
     print()
     build_libgourou()
+    find_tool.cache_clear()
     print("\n=== Setup complete! ===")
     print("You can now convert ACSM files:")
     print("  python3 converter.py ebook.acsm")
@@ -159,20 +209,24 @@ def do_setup():
 # ─── Conversion ──────────────────────────────────────────────────────────
 
 
+# Fully qualified tag of the fulfillment source element in ACSM documents
+_ADEPT_SRC_TAG = "{http://ns.adobe.com/adept}src"
+
+
 def detect_format(acsm_path):
     """Parse the ACSM file and raise an error if it is not EPUB."""
-    tree = ET.parse(acsm_path)
-    root = tree.getroot()
-    ns = {"adept": "http://ns.adobe.com/adept"}
-
-    src_elem = root.find(".//adept:src", ns)
-    if src_elem is not None and src_elem.text:
-        src = src_elem.text.lower()
-        if ".pdf" in src or "output=pdf" in src:
-            raise RuntimeError(
-                "This ACSM file points to a PDF ebook. "
-                "Only EPUB-sourced ACSM files are supported."
-            )
+    # Stream instead of building the full tree: <src> sits near the top of
+    # ACSM documents, so we can stop parsing at the first hit.
+    for _, elem in ET.iterparse(acsm_path, events=("end",)):
+        if elem.tag == _ADEPT_SRC_TAG:
+            src = (elem.text or "").lower()
+            if ".pdf" in src or "output=pdf" in src:
+                raise RuntimeError(
+                    "This ACSM file points to a PDF ebook. "
+                    "Only EPUB-sourced ACSM files are supported."
+                )
+            break
+        elem.clear()
 
     # Treat unknown/missing src as EPUB (most common case)
     return "epub"
@@ -188,7 +242,7 @@ def register_device():
     print("Registering Adobe device (anonymous)...")
     tool = find_tool("adept_activate")
     try:
-        result = run([tool, "-a"], timeout=30)
+        result = run_streamed([tool, "-a"], timeout=30)
     except subprocess.TimeoutExpired:
         raise RuntimeError("Device registration timed out (30s).")
     if result.returncode != 0:
@@ -202,7 +256,7 @@ def fulfill_acsm(acsm_path, output_path):
     print(f"Fulfilling ACSM: {acsm_path.name}")
     tool = find_tool("acsmdownloader")
     try:
-        result = run([tool, "-f", str(acsm_path), "-o", str(output_path)], timeout=120)
+        result = run_streamed([tool, "-f", str(acsm_path), "-o", str(output_path)], timeout=120)
     except subprocess.TimeoutExpired:
         raise RuntimeError("Download timed out (120s). The ACSM token may be expired or the server is unreachable.")
     if result.returncode != 0:
@@ -221,7 +275,7 @@ def remove_drm(input_path, output_path):
     print(f"Removing DRM: {input_path.name}")
     tool = find_tool("adept_remove")
     try:
-        result = run([tool, "-f", str(input_path), "-o", str(output_path)], timeout=60)
+        result = run_streamed([tool, "-f", str(input_path), "-o", str(output_path)], timeout=60)
     except subprocess.TimeoutExpired:
         raise RuntimeError("DRM removal timed out (60s).")
     if result.returncode != 0:
@@ -301,7 +355,7 @@ def _collect_links_from_html(zip_path: str, text: str) -> list[str]:
     # --- XML/HTML attribute scanning ---
     try:
         root = ET.fromstring(text.encode("utf-8", errors="replace"))
-        for elem in root.iter():
+        for elem in root.iter("*"):
             local_tag = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
             for attr in _LINK_ATTRS.get(local_tag, []):
                 val = elem.get(attr, "").strip()
@@ -337,7 +391,7 @@ def _collect_links_from_ncx(text: str) -> list[str]:
     links: list[str] = []
     try:
         root = ET.fromstring(text.encode("utf-8", errors="replace"))
-        for elem in root.iter():
+        for elem in root.iter("*"):
             local = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
             if local == "content":
                 src = elem.get("src", "").strip()
@@ -354,7 +408,7 @@ def _collect_links_from_nav(text: str) -> list[str]:
     links: list[str] = []
     try:
         root = ET.fromstring(text.encode("utf-8", errors="replace"))
-        for elem in root.iter():
+        for elem in root.iter("*"):
             local = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
             if local == "a":
                 href = (elem.get("href") or "").strip()
@@ -447,9 +501,10 @@ def verify_epub_links(epub_path: Path) -> LinkCheckResult:
         # ── Check for residual encryption ─────────────────────────────────
         if "META-INF/encryption.xml" in zip_names_set:
             try:
-                enc_xml = zf.read("META-INF/encryption.xml").decode("utf-8", errors="replace")
-                enc_root = ET.fromstring(enc_xml)
-                for elem in enc_root.iter():
+                # Feed raw bytes to the parser: lxml rejects str input that
+                # carries an XML encoding declaration
+                enc_root = ET.fromstring(zf.read("META-INF/encryption.xml"))
+                for elem in enc_root.iter("*"):
                     local = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
                     if local == "cipherreference":
                         uri = elem.get("URI", "").strip()
@@ -463,9 +518,8 @@ def verify_epub_links(epub_path: Path) -> LinkCheckResult:
         # Try container.xml first (standard)
         if "META-INF/container.xml" in zip_names_set:
             try:
-                container_xml = zf.read("META-INF/container.xml").decode("utf-8", errors="replace")
-                c_root = ET.fromstring(container_xml)
-                for elem in c_root.iter():
+                c_root = ET.fromstring(zf.read("META-INF/container.xml"))
+                for elem in c_root.iter("*"):
                     local = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
                     if local == "rootfile":
                         opf_path = elem.get("full-path", "").strip()
@@ -482,11 +536,10 @@ def verify_epub_links(epub_path: Path) -> LinkCheckResult:
 
         if opf_path:
             try:
-                opf_xml = zf.read(opf_path).decode("utf-8", errors="replace")
-                opf_root = ET.fromstring(opf_xml)
+                opf_root = ET.fromstring(zf.read(opf_path))
                 opf_dir = str(PurePosixPath(opf_path).parent)
 
-                for elem in opf_root.iter():
+                for elem in opf_root.iter("*"):
                     local = elem.tag.split("}")[-1].lower() if "}" in elem.tag else elem.tag.lower()
                     if local == "item":
                         item_id = elem.get("id", "")
@@ -587,7 +640,9 @@ def convert_pipeline(acsm_path, output_dir):
       5. Remove DRM
       6. Verify link integrity
     """
-    acsm_path = Path(acsm_path).resolve()
+    # absolute() is pure path arithmetic; resolve() would walk the whole
+    # path with a syscall per component just to chase symlinks we don't have
+    acsm_path = Path(acsm_path).absolute()
     if not acsm_path.exists():
         raise RuntimeError(f"File not found: {acsm_path}")
     if acsm_path.suffix != ".acsm":